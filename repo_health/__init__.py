@@ -2,18 +2,24 @@
 This package contains checks for edx repo standards
 """
 import codecs
+import functools
 import os
 from configparser import ConfigParser
 from pathlib import Path
 import glob
 import pytest
 import dockerfile
+import yaml
 
 __version__ = "0.1.6"
 
 
 GITHUB_URL_PATTERN = r"github.com[/:](?P<org_name>[^/]+)/(?P<repo_name>[^/]+).*#egg=(?P<package>[^\/]+).*"
 
+# Use the libyaml-backed loader when PyYAML was built with it, it is much faster
+# than the pure-Python SafeLoader and accepts the same documents.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def parse_config_file(path):
     """
@@ -26,15 +32,27 @@ def parse_config_file(path):
     return config
 
 
+@functools.lru_cache(maxsize=256)
+def _read_text_file(path, modified_time):  # pylint: disable=unused-argument
+    """
+    Read the UTF-8 text file at path. Several checks read the same files (setup.py,
+    requirements files, ...), so results are cached; modified_time is part of the
+    cache key so that a changed file is read again.
+    """
+    with codecs.open(path, "r", "utf-8") as f:
+        return f.read()
+
+
 def get_file_content(path):
     """
     Get the content of the UTF-8 text file at the specified path.
     Used for pytest fixtures.
     """
-    if not os.path.exists(path):
+    try:
+        modified_time = os.stat(path).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
         return ""
-    with codecs.open(path, "r", "utf-8") as f:
-        return f.read()
+    return _read_text_file(os.fspath(path), modified_time)
 
 
 def get_file_lines(path):
@@ -43,10 +61,14 @@ def get_file_lines(path):
     Strips leading and trailing whitespace from each line.
     Used for pytest fixtures.
     """
-    if not os.path.exists(path):
-        return []
-    with codecs.open(path, "r", "utf-8") as f:
-        return [line.strip() for line in f.readlines()]
+    return [line.strip() for line in get_file_content(path).splitlines()]
+
+
+def strip_requirement_line(line):
+    """
+    Remove any trailing " # comment" and "-e " flag from a line of a requirements file.
+    """
+    return line.partition(" #")[0].rstrip().replace("-e ", "")
 
 
 def get_file_names(path, file_type):
@@ -59,6 +81,15 @@ def get_file_names(path, file_type):
     return files
 
 
+@functools.lru_cache(maxsize=None)
+def get_requirement_files(repo_path):
+    """
+    Get a tuple of the .txt files in repo_path's requirements directory and its subdirectories.
+    Cached per repo_path, since several checks walk the same requirements tree.
+    """
+    return tuple(str(file) for file in Path(os.path.join(repo_path, "requirements")).rglob('*.txt'))
+
+
 @pytest.fixture(name='readme')
 def fixture_readme(repo_path):
     """Fixture producing the text of the readme file."""
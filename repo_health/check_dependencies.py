@@ -1,49 +1,52 @@
 """
  contains check that reads/parses dependencies of a repo
 """
-import copy
 import json
 import logging
 import os
-import re
 from abc import ABC, abstractmethod
-from pathlib import Path
 
 from pytest_repo_health import health_metadata
 
-from repo_health import get_file_lines, get_file_content
+from repo_health import get_file_lines, get_requirement_files, strip_requirement_line
+from repo_health.utils import file_exists
 
 logger = logging.getLogger(__name__)
 
 module_dict_key = "dependencies"
 
-default_output = {
-    "count": 0,
-    "github": {
-        "count": 0,
-        "list": ""
-    },
-    "pypi_all": {
-        "count": 0,
-        "list": ""
-    },
-    "pypi": {
-        "count": 0,
-        "list": ""
-    },
-    "js": {
-        "count": 0,
-        "list": "",
-    },
-    "js.dev": {
-        "count": 0,
-        "list": ""
-    },
-    "js.all": {
+
+def get_default_output():
+    """
+    Build a fresh copy of the dependencies output with every count and list empty
+    """
+    return {
         "count": 0,
-        "list": ""
+        "github": {
+            "count": 0,
+            "list": ""
+        },
+        "pypi_all": {
+            "count": 0,
+            "list": ""
+        },
+        "pypi": {
+            "count": 0,
+            "list": ""
+        },
+        "js": {
+            "count": 0,
+            "list": "",
+        },
+        "js.dev": {
+            "count": 0,
+            "list": ""
+        },
+        "js.all": {
+            "count": 0,
+            "list": ""
+        }
     }
-}
 
 
 class DependencyReader(ABC):
@@ -76,27 +79,29 @@ class JavascriptDependencyReader(DependencyReader):
         self.js_dev_dependencies_count = 0
 
     def _is_js_repo(self) -> bool:
-        return os.path.exists(os.path.join(self._repo_path, "package.json"))
+        return file_exists(self._repo_path, "package.json")
 
     def _read_dependencies(self) -> dict:
         """
         method processing javascript dependencies file
         """
-        package_json_content = open(  # pylint: disable=consider-using-with
-            os.path.join(self._repo_path, "package.json"), 'r', encoding="utf8"
-        ).read()
-        package_json_data = json.loads(package_json_content)
+        with open(os.path.join(self._repo_path, "package.json"), 'rb') as package_json:
+            package_json_data = json.load(package_json)
 
         self.js_dependencies = package_json_data.get('dependencies', {})
         self.js_dev_dependencies = package_json_data.get('devDependencies', {})
         self.js_dependencies_count = len(self.js_dependencies)
         self.js_dev_dependencies_count = len(self.js_dev_dependencies)
 
-        package_lock_content = get_file_content(os.path.join(self._repo_path, "package-lock.json"))
-        if package_lock_content:
-            package_lock_data = json.loads(package_lock_content)
-            for dependency, details in package_lock_data.get('dependencies', {}).items():
-                self.js_dependencies_all[dependency] = details["version"]
+        package_lock_path = os.path.join(self._repo_path, "package-lock.json")
+        # an empty package-lock.json has nothing to parse
+        if os.path.exists(package_lock_path) and os.path.getsize(package_lock_path):
+            with open(package_lock_path, 'rb') as package_lock:
+                package_lock_data = json.load(package_lock)
+            self.js_dependencies_all = {
+                dependency: details["version"]
+                for dependency, details in package_lock_data.get('dependencies', {}).items()
+            }
 
         return {
             "count": self.js_dependencies_count + self.js_dev_dependencies_count,
@@ -132,82 +137,96 @@ class PythonDependencyReader(DependencyReader):
         self.production_packages = None
 
     def _is_python_repo(self) -> bool:
-        return os.path.exists(os.path.join(self._repo_path, "requirements"))
+        return bool(get_requirement_files(self._repo_path))
 
     def _read_dependencies(self) -> dict:
         """
         method processing python requirements files
         """
-        pypi_packages = []
-        github_packages = []
-        production_packages = []
+        pypi_packages = set()
+        github_packages = set()
+        production_packages = set()
 
-        files = [str(file) for file in Path(os.path.join(self._repo_path, "requirements")).rglob('*.txt')]
+        files = get_requirement_files(self._repo_path)
 
         constraints_files = ("constraints.txt", "pins.txt",)
         requirement_files = [file for file in files if not file.endswith(constraints_files)]
 
-        for file_path in requirement_files:
-            lines = get_file_lines(file_path)
-            stripped_lines = [re.sub(r' +#.*', "", line).replace('-e ', "")
-                              for line in lines if line and not line.startswith("#")]
-            github_packages.extend([line for line in stripped_lines if re.match(r'^git\+.*', line)])
-            pypi_packages.extend([line for line in stripped_lines if line not in github_packages and "==" in line])
+        lines_by_file = self._read_requirement_files(requirement_files)
+        for stripped_lines in lines_by_file.values():
+            github_packages.update(stripped_lines["github"])
+            pypi_packages.update(stripped_lines["pypi"])
 
-        self.github_dependencies = list(set(github_packages))
-        self.pypi_dependencies = list(set(pypi_packages))
+        self.github_dependencies = list(github_packages)
+        self.pypi_dependencies = list(pypi_packages)
 
         # services have production.txt and base.txt but packages have only base.txt
         # so if both appeared only pick production.
         # few packages have development.txt or dev.txt also.
 
         priority_list = ["production.txt", "base.txt", "development.txt", "dev.txt"]
-        for file_name in priority_list:
-            requirement_files = [file for file in files if file.endswith(file_name)]
-            if requirement_files:
-                break
+        files_by_name = {file_name: [] for file_name in priority_list}
+        for file in files:
+            base_name = os.path.basename(file)
+            for file_name in priority_list:
+                if base_name.endswith(file_name):
+                    files_by_name[file_name].append(file)
+                    break
+        requirement_files = next((files_by_name[name] for name in priority_list if files_by_name[name]), [])
 
         if not requirement_files:
             logger.error("No production.txt or base.txt files found for this repo %s", self._repo_path)
 
+        # production files are never constraints files, so they were all read above
         for file_path in requirement_files:
-            lines = get_file_lines(file_path)
-            stripped_lines = self.cleanup_lines(lines)
-            production_packages.extend(stripped_lines["pypi"])
+            production_packages.update(lines_by_file[file_path]["pypi"])
 
-        self.production_packages = list(set(production_packages))
+        self.production_packages = list(production_packages)
 
+        github_count = len(self.github_dependencies)
+        pypi_count = len(self.pypi_dependencies)
         return {
             "github": {
-                "count": len(set(self.github_dependencies)),
-                "list": json.dumps(github_packages),
+                "count": github_count,
+                "list": json.dumps(self.github_dependencies),
             },
             "pypi_all": {
-                "count": len(set(self.pypi_dependencies)),
+                "count": pypi_count,
                 "list": json.dumps(self.pypi_dependencies),
             },
             "pypi": {
-                "count": len(set(self.production_packages)),
+                "count": len(self.production_packages),
                 "list": json.dumps(self.production_packages),
             },
-            "count": len(set(self.pypi_dependencies)) + len(set(self.github_dependencies))
+            "count": pypi_count + github_count
         }
 
+    def _read_requirement_files(self, file_paths) -> dict:
+        """
+        Read and clean up the given requirements files.
+        @return: dict of file path -> cleaned up lines of that file
+        """
+        return {file_path: self.cleanup_lines(get_file_lines(file_path)) for file_path in file_paths}
+
     def cleanup_lines(self, lines):
         """
         remove un-necessary strings from lines.
         @return: dependencies_output
         """
-        stripped_lines = [
-            re.sub(r' +#.*', "", line).replace('-e ', "")
-            for line in lines if line and not line.startswith("#")
-        ]
-
-        github_packages = [line for line in stripped_lines if re.match(r'^git\+.*', line)]
+        github_packages = []
+        pypi_packages = []
+        for raw_line in lines:
+            if not raw_line or raw_line.startswith("#"):
+                continue
+            line = strip_requirement_line(raw_line)
+            if line.startswith("git+"):
+                github_packages.append(line)
+            elif "==" in line:
+                pypi_packages.append(line)
 
         return {
             'github': github_packages,
-            'pypi': [line for line in stripped_lines if line not in github_packages and "==" in line]
+            'pypi': pypi_packages
         }
 
     def read(self) -> dict:
@@ -223,7 +242,7 @@ def get_dependencies(repo_path) -> dict:
     @return: dependencies_output
     """
     dependencies_count = 0
-    dependencies_output = copy.deepcopy(default_output)
+    dependencies_output = get_default_output()
     for reader in DependencyReader.__subclasses__():
         reader_instance = reader(repo_path)
         result = reader_instance.read()
@@ -4,19 +4,22 @@
 import csv
 import json
 import logging
-import os
 import re
-from pathlib import Path
+import string
 
 from pytest_repo_health import health_metadata
 
 from repo_health_dashboard.utils.utils import get_django_dependency_sheet
-from repo_health import get_file_lines, GITHUB_URL_PATTERN
+from repo_health import get_file_lines, get_requirement_files, strip_requirement_line, GITHUB_URL_PATTERN
 
 logger = logging.getLogger(__name__)
 
 MODULE_DICT_KEY = "django_related_dependencies"
 
+GITHUB_URL_REGEX = re.compile(GITHUB_URL_PATTERN)
+# Translation table that deletes all whitespace from a string
+WHITESPACE_TABLE = str.maketrans('', '', string.whitespace)
+
 
 class DjangoDependencyReader:
     """
@@ -28,7 +31,7 @@ class DjangoDependencyReader:
         self.dependencies = set()
 
     def _is_python_repo(self) -> bool:
-        return os.path.exists(os.path.join(self.repo_path, "requirements"))
+        return bool(get_requirement_files(self.repo_path))
 
     def _read_dependencies(self):
         """
@@ -36,12 +39,10 @@ class DjangoDependencyReader:
         """
         dependencies = []
 
-        requirement_files = [str(file) for file in Path(os.path.join(self.repo_path, "requirements")).rglob('*.txt')]
-
-        for file_path in requirement_files:
+        for file_path in get_requirement_files(self.repo_path):
             lines = get_file_lines(file_path)
-            stripped_lines = [re.sub(r' +#.*', "", line).replace('-e ', "") for line in lines if line
-                              and not any(line.startswith(start) for start in ['#', '-c', '-r'])]
+            stripped_lines = [strip_requirement_line(line) for line in lines
+                              if line and not line.startswith(('#', '-c', '-r'))]
             github_deps = [self.clean(self.extract(line)) for line in stripped_lines if 'git+http' in line]
             pypi_deps = [self.clean(line.strip()) for line in stripped_lines if line not in github_deps]
 
@@ -54,7 +55,7 @@ class DjangoDependencyReader:
         """
         Extracts the package name from Github URL
         """
-        match = re.search(GITHUB_URL_PATTERN, github_dep)
+        match = GITHUB_URL_REGEX.search(github_dep)
 
         return match.group("package") if match else ''
 
@@ -63,10 +64,10 @@ class DjangoDependencyReader:
         """
         Sanitizes the package name from any version constraint and extra spaces
         """
-        pypi_dependency = "".join(pypi_dependency.split())
-        splitter = [symbol for symbol in ['>', '<', '=='] if symbol in pypi_dependency]
-        if splitter:
-            return pypi_dependency.split(splitter[0], maxsplit=1)[0]
+        pypi_dependency = pypi_dependency.translate(WHITESPACE_TABLE)
+        for symbol in ('>', '<', '=='):
+            if symbol in pypi_dependency:
+                return pypi_dependency.split(symbol, maxsplit=1)[0]
 
         return pypi_dependency
 
@@ -81,6 +82,20 @@ class DjangoDependencyReader:
         return self.dependencies
 
 
+def read_django_dependency_sheet(csv_path):
+    """
+    Read the django dependencies sheet into a dict of package name -> whether it supports Django 3.2.
+    """
+    sheet = {}
+    with open(csv_path, encoding="utf8") as csv_file:
+        csv_reader = csv.DictReader(csv_file, delimiter=',', quotechar='"')
+        for line in csv_reader:
+            package_name = line["Django Package Name"]
+            supports_django32 = bool(line["Django 3.2"]) and line["Django 3.2"] != '-'
+            sheet[package_name] = sheet.get(package_name, False) or supports_django32
+    return sheet
+
+
 def get_upgraded_dependencies_count(repo_path) -> tuple:
     """
     entry point to read parse and read dependencies
@@ -89,20 +104,12 @@ def get_upgraded_dependencies_count(repo_path) -> tuple:
     """
     reader_instance = DjangoDependencyReader(repo_path)
     deps = reader_instance.read()
-    django_deps = []
-    deps_support_django32 = []
 
-    csv_path = get_django_dependency_sheet()
-    with open(csv_path, encoding="utf8") as csv_file:
-        csv_reader = csv.DictReader(csv_file, delimiter=',', quotechar='"')
-        for line in csv_reader:
-            if line["Django Package Name"] in deps:
-                django_deps.append(line["Django Package Name"])
-                if line["Django 3.2"] and line["Django 3.2"] != '-':
-                    deps_support_django32.append(line["Django Package Name"])
+    csv_path = str(get_django_dependency_sheet())
+    sheet = read_django_dependency_sheet(csv_path)
 
-    django_deps = list(set(django_deps))
-    deps_support_django32 = list(set(deps_support_django32))
+    django_deps = [dep for dep in deps if dep in sheet]
+    deps_support_django32 = [dep for dep in django_deps if sheet[dep]]
 
     return django_deps, deps_support_django32
 
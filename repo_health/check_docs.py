@@ -12,7 +12,7 @@ import yaml
 
 from pytest_repo_health import health_metadata
 
-from repo_health import fixture_readme, get_file_content  # pylint: disable=unused-import
+from repo_health import YAML_LOADER, fixture_readme, get_file_content  # pylint: disable=unused-import
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +65,7 @@ class ReadTheDocsChecker:
         """
         readthedocs_yml = self._read_readthedocs_yml_file()
         try:
-            data = yaml.safe_load(readthedocs_yml)
+            data = yaml.load(readthedocs_yml, Loader=YAML_LOADER)
             data = {} if data is None else data
             return data
         except yaml.YAMLError:
@@ -1,12 +1,11 @@
 """
 Checks to collect useful information from the GitHub API about the target repository.
 """
-import functools
 import json
 import logging
-import operator
 import os
 import re
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 import requests
@@ -17,8 +16,12 @@ from .utils import parse_build_duration_response
 
 logger = logging.getLogger(__name__)
 
+# Shared across GitHub REST calls so their connections are reused
+github_api_session = requests.Session()
+
 MODULE_DICT_KEY = "github"
 URL_PATTERN = r"github.com[/:](?P<org_name>[^/]+)/(?P<repo_name>[^/]+).git"
+URL_REGEX = re.compile(URL_PATTERN)
 
 FETCH_REPOSITORY_LANGUAGES = """
 query fetch_repository_languages ($repository_id: ID!, $cursor: String=null) {
@@ -74,7 +77,7 @@ async def fetch_languages(repo):
         }
 
         data = await client.request(json=_json)
-        data = functools.reduce(operator.getitem, ["node", "languages"], data)
+        data = data["node"]["languages"]
 
         edges.extend(data["edges"])
 
@@ -234,7 +237,7 @@ def check_branch_and_pr_count(all_results, git_origin_url):
     """
     Checks repository integrated with github actions workflow
     """
-    match = re.search(URL_PATTERN, git_origin_url)
+    match = URL_REGEX.search(git_origin_url)
     repo_name = match.group("repo_name")
     all_results[MODULE_DICT_KEY]['branch_count'] = get_branch_or_pr_count(repo_name, 'branches')
     all_results[MODULE_DICT_KEY]['pulls_count'] = get_branch_or_pr_count(repo_name, 'pulls')
@@ -247,11 +250,11 @@ def get_branch_or_pr_count(repo_name, pulls_or_branches):
     url = f"https://api.github.com/repos/edx/{repo_name}/{pulls_or_branches}?per_page=1"
     count = 0
 
-    response = requests.get(url=url, headers={'Authorization': f'Bearer {os.environ["GITHUB_TOKEN"]}'})
+    response = github_api_session.get(url=url, headers={'Authorization': f'Bearer {os.environ["GITHUB_TOKEN"]}'})
     if response.ok and json.loads(response.content):
         count = 1
         if 'last' in response.links:
             last_page = response.links['last']['url']
-            count = int(re.findall(r'page=(\d+)', last_page)[1])
+            count = int(parse_qs(urlparse(last_page).query)['page'][0])
 
     return count
@@ -21,7 +21,7 @@ def get_dependencies(repo_path):
     full_path = os.path.join(repo_path, "package.json")
     content = get_file_content(full_path)
     if content:
-        return json.loads(get_file_content(full_path))
+        return json.loads(content)
 
     return {}
 
@@ -8,7 +8,7 @@ import yaml
 
 from pytest_repo_health import add_key_to_metadata, health_metadata
 
-from repo_health import get_file_content
+from repo_health import YAML_LOADER, get_file_content
 
 # Decision: require openedx.yaml to be parsable
 
@@ -36,7 +36,7 @@ def fixture_parsed_data(openedx_yaml):
     Parses openedx.yaml returns resulting dict.
     """
     try:
-        data = yaml.safe_load(openedx_yaml)
+        data = yaml.load(openedx_yaml, Loader=YAML_LOADER)
         if data is None:
             return {}
         return data
@@ -50,7 +50,7 @@ def check_yaml_parsable(openedx_yaml, all_results):
     Is the openedx.yaml file computer parsable
     """
     try:
-        data = yaml.safe_load(openedx_yaml)
+        data = yaml.load(openedx_yaml, Loader=YAML_LOADER)
         all_results[module_dict_key]["parsable"] = bool(data)
     except yaml.YAMLError:
         all_results[module_dict_key]["parsable"] = False
@@ -2,8 +2,10 @@
 Check some details in the readme file.
 """
 
+import functools
 import re
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 
@@ -17,13 +19,13 @@ GOOD_THINGS = {
     "security": {
         "description": "Has a security contact",
         "re": [
-            r"security@edx\.org",
+            re.compile(r"security@edx\.org"),
         ],
     },
     "getting-help": {
         "description": "Has a link to get help",
         "re": [
-            r"https://open\.?edx\.org/getting-help",
+            re.compile(r"https://open\.?edx\.org/getting-help"),
         ],
     },
 }
@@ -34,17 +36,22 @@ BAD_THINGS = {
     "irc-missing": {
         "description": "Avoids obsolete IRC info",
         "re": [
-            r"(?i)`#?edx-code`? IRC channel",
+            re.compile(r"(?i)`#?edx-code`? IRC channel"),
         ],
     },
     "mailing-list-missing": {
         "description": "Avoids obsolete mailing list info",
         "re": [
-            r"https?://groups.google.com/forum/#!forum/edx-code",
+            re.compile(r"https?://groups.google.com/forum/#!forum/edx-code"),
         ],
     },
 }
 
+# (key, patterns) pairs built once at import, so each README is searched key by key
+# without walking GOOD_THINGS/BAD_THINGS again.
+GOOD_THINGS_ITEMS = [(key, val["re"]) for key, val in GOOD_THINGS.items()]
+BAD_THINGS_ITEMS = [(key, val["re"]) for key, val in BAD_THINGS.items()]
+
 
 @health_metadata(
     [module_dict_key],
@@ -60,18 +67,18 @@ def check_readme_contents(readme, all_results):
     if readme is None:
         return
 
-    for key, val in GOOD_THINGS.items():
-        present = any(re.search(regex, readme) for regex in val["re"])
+    for key, patterns in GOOD_THINGS_ITEMS:
+        present = any(regex.search(readme) for regex in patterns)
         all_results[module_dict_key][key] = present
-    for key, val in BAD_THINGS.items():
-        present = any(re.search(regex, readme) for regex in val["re"])
+    for key, patterns in BAD_THINGS_ITEMS:
+        present = any(regex.search(readme) for regex in patterns)
         all_results[module_dict_key][key] = not present
 
 
 # URLs have to start with a scheme, but can have lots of stuff in them. They
 # have to end with word or slash, so that trailing punctuation won't be
 # included.
-URL_REGEX = r"https?://[\w._/?&%=@+\-\[\]]+[\w/]"
+URL_REGEX = re.compile(r"https?://[\w._/?&%=@+\-\[\]]+[\w/]")
 
 # Some links in READMEs are just examples, don't bother checking these domains.
 EXAMPLE_DOMAINS = {
@@ -82,13 +89,13 @@ EXAMPLE_DOMAINS = {
 }
 
 # If a URL has any weird meta-characters, it's not a real URL.
-METACHARACTERS = r"[\[\]]"
+METACHARACTERS = re.compile(r"[\[\]]")
 
 def is_example_url(url):
     """
     Is this URL just an example, no need to check it?
     """
-    if re.search(METACHARACTERS, url):
+    if METACHARACTERS.search(url):
         return True
     parts = urllib.parse.urlparse(url)
     for domain in EXAMPLE_DOMAINS:
@@ -98,6 +105,28 @@ def is_example_url(url):
             return True
     return False
 
+
+# Links are checked concurrently, at most this many at a time.
+MAX_LINK_CHECK_WORKERS = 16
+
+# Seconds to wait for each link before giving up on it.
+LINK_CHECK_TIMEOUT = 5
+
+
+def check_link(session, url):
+    """
+    Fetch the headers of `url`, returning an error message if it is broken or None if it is good.
+    """
+    try:
+        resp = session.head(url, allow_redirects=True, timeout=LINK_CHECK_TIMEOUT)
+    except (requests.ConnectionError, requests.Timeout) as e:
+        return f"{url}: {e}"
+
+    if 200 <= resp.status_code <= 300:
+        return None
+    return f"{url}: {resp.status_code}"
+
+
 @health_metadata(
     [module_dict_key],
     {
@@ -112,23 +141,19 @@ def check_readme_links(readme, all_results):
     if readme is None:
         return
 
-    seen = set()
     bad = all_results[module_dict_key]["bad_links"] = []
     good = all_results[module_dict_key]["good_links"] = []
 
-    for url in re.findall(URL_REGEX, readme):
-        if url in seen:
-            continue
-        seen.add(url)
-        if is_example_url(url):
-            continue
-        try:
-            resp = requests.head(url, allow_redirects=True)
-        except requests.ConnectionError as e:
-            bad.append(f"{url}: {e}")
-            continue
-
-        if 200 <= resp.status_code <= 300:
-            good.append(url)
-        else:
-            bad.append(f"{url}: {resp.status_code}")
+    # dict.fromkeys drops repeated links but keeps them in README order.
+    urls = [url for url in dict.fromkeys(URL_REGEX.findall(readme)) if not is_example_url(url)]
+    if not urls:
+        return
+
+    with requests.Session() as session, \
+            ThreadPoolExecutor(max_workers=min(MAX_LINK_CHECK_WORKERS, len(urls))) as executor:
+        errors = executor.map(functools.partial(check_link, session), urls)
+        for url, error in zip(urls, errors):
+            if error is None:
+                good.append(url)
+            else:
+                bad.append(error)
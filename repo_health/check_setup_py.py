@@ -12,6 +12,12 @@ from repo_health import get_file_content
 
 module_dict_key = "setup_py"
 
+PYTHON_CLASSIFIER_REGEX = re.compile(r"Programming Language :: Python :: ([\d\.]+)", re.MULTILINE)
+# Look in setup.py for:     name="package",
+SETUP_PY_NAME_REGEX = re.compile(r"""(?m)^\s+name\s?=\s?['"]([\w-]+)['"],""")
+# Look in setup.cfg for:    name=package
+SETUP_CFG_NAME_REGEX = re.compile(r"""(?m)^name\s?=\s?([\w-]+)""")
+
 
 @pytest.fixture(name="setup_py")
 def fixture_setup_py(repo_path):
@@ -32,8 +38,7 @@ def fixture_python_version(setup_py):
     """
     The list of python versions in setup.py classifiers
     """
-    regex_pattern = r"Programming Language :: Python :: ([\d\.]+)"
-    python_classifiers = re.findall(regex_pattern, setup_py, re.MULTILINE)
+    python_classifiers = PYTHON_CLASSIFIER_REGEX.findall(setup_py)
     return python_classifiers
 
 
@@ -58,10 +63,8 @@ def check_pypi_name(setup_py, setup_cfg, all_results):
     """
     Get the name of the PyPI package for this repo.
     """
-    # Look in setup.py for:     name="package",
-    py_names = re.findall(r"""(?m)^\s+name\s?=\s?['"]([\w-]+)['"],""", setup_py)
-    # Look in setup.cfg for:    name=package
-    cfg_names = re.findall(r"""(?m)^name\s?=\s?([\w-]+)""", setup_cfg)
+    py_names = SETUP_PY_NAME_REGEX.findall(setup_py)
+    cfg_names = SETUP_CFG_NAME_REGEX.findall(setup_cfg)
 
     names = py_names + cfg_names
     if names:
@@ -7,7 +7,7 @@ import pytest
 import yaml
 
 from pytest_repo_health import add_key_to_metadata
-from repo_health import get_file_content
+from repo_health import YAML_LOADER, get_file_content
 
 
 module_dict_key = "travis_yml"
@@ -26,7 +26,7 @@ def fixture_parsed_data(travis_yml):
     Parses travis.yml returns resulting dict.
     """
     try:
-        data = yaml.safe_load(travis_yml)
+        data = yaml.load(travis_yml, Loader=YAML_LOADER)
         if data is None:
             return {}
         return data
@@ -40,7 +40,7 @@ def check_yaml_parsable(travis_yml, all_results):
     Is the travis.yml file computer parsable
     """
     try:
-        data = yaml.safe_load(travis_yml)
+        data = yaml.load(travis_yml, Loader=YAML_LOADER)
         all_results[module_dict_key]["parsable"] = bool(data)
     except yaml.YAMLError:
         all_results[module_dict_key]["parsable"] = False
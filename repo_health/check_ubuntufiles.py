@@ -7,14 +7,13 @@ import json
 import logging
 import os
 import re
-from pathlib import Path
 
 import pytest
 import yaml
 
 from pytest_repo_health import health_metadata
 
-from repo_health import get_file_lines, read_docker_file
+from repo_health import YAML_LOADER, get_file_lines, get_requirement_files, read_docker_file
 
 from repo_health.check_travis_integration import URL_PATTERN
 
@@ -91,7 +90,7 @@ class PlaybookAPTPackagesReader:
         self.data_yml = {}
         for file in glob.glob(pattern, recursive=True):
             with open(file, encoding="utf8") as infile:
-                yml = yaml.safe_load(infile)
+                yml = yaml.load(infile, Loader=YAML_LOADER)
                 if yml:
                     try:
                         self.data_yml.update(yml)
@@ -211,7 +210,7 @@ class PlaybookAPTPackagesReader:
             for file in glob.glob(f'{playbook_path}/tasks/*.yml', recursive=True):
                 full_path = os.path.join(playbook_path, file)
                 with open(full_path, encoding="utf8") as target_file:
-                    tasks_yml = yaml.safe_load(target_file)
+                    tasks_yml = yaml.load(target_file, Loader=YAML_LOADER)
                 if tasks_yml is None:
                     continue
 
@@ -258,7 +257,7 @@ def get_apt_get_txt(repo_path):
     # check files on root or in requirements folder
     content = get_file_lines(full_path)
     if not content:
-        files = [str(file) for file in Path(os.path.join(repo_path, "requirements")).rglob('apt-packages.txt')]
+        files = [file for file in get_requirement_files(repo_path) if os.path.basename(file) == 'apt-packages.txt']
         if files:
             content = get_file_lines(files[0])  # only one file will exists
 
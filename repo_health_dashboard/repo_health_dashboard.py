@@ -12,6 +12,9 @@ import yaml
 
 from .utils import utils
 
+# Use the libyaml-backed loader when available; the data dir can hold hundreds of files.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def main():
     """
@@ -48,21 +51,21 @@ def main():
     if args.configuration:
         with codecs.open(args.configuration, "r", "utf-8") as f:
             file_data = f.read()
-            parsed_file_data = yaml.safe_load(file_data)
+            parsed_file_data = yaml.load(file_data, Loader=YAML_LOADER)
             sheets = parsed_file_data.keys()
             for sheet in sheets:
                 configurations[sheet] = utils.get_sheets(parsed_file_data, sheet)
 
     data_dir = os.path.abspath(args.data_dir)
     files = glob.glob(os.path.join(data_dir, "*.yaml"), recursive=False)
-    data = {}
+    store = utils.MetadataStore()
     for file_path in files:
         file_name = file_path[file_path.rfind("/") + 1 :]
         repo_name = file_name.replace("_repo_health.yaml", "")
         # TODO(jinder): maybe add a try block here
         with codecs.open(file_path, "r", "utf-8") as f:
             file_data = f.read()
-            parsed_file_data = yaml.safe_load(file_data)
+            parsed_file_data = yaml.load(file_data, Loader=YAML_LOADER)
             date_of_collection = parsed_file_data["TIMESTAMP"]
             today_date = datetime.datetime.now().date()
             days_since_collection = abs((today_date - date_of_collection).days)
@@ -71,12 +74,11 @@ def main():
 
             org_name = f'{parsed_file_data["org_name"]}/' if "org_name" in parsed_file_data else ''
             org_repo_name = f'{org_name}{repo_name}'
-            data[org_repo_name] = parsed_file_data
+            store.add(org_repo_name, parsed_file_data)
 
-    output = utils.squash_and_standardize_metadata_by_repo(data)
     for key, configuration in configurations.items():
         utils.write_squashed_metadata_to_csv(
-            output, args.output_csv + "_" + key, configuration
+            store.repos, args.output_csv + "_" + key, configuration, store.superset_keys
         )
 
 
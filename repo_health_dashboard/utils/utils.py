@@ -10,6 +10,9 @@ import requests
 DJANGO_DEPS_SHEET_URL = "https://docs.google.com/spreadsheets/d/" \
                         "19-BzpcX3XvqlazHcLhn1ZifBMVNund15EwY3QQM390M/export?format=csv"
 
+# Write dashboards through a 1MB buffer so rows reach the disk in a few large writes
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
 
 def get_django_dependency_sheet():
     """
@@ -30,16 +33,27 @@ def squash_dict(input_dict, delimiter="."):
     For example:
     for input: {'a':{'b':'1', 'c':{'d':'2'}, 'f':[1,2,3]}, 'e':2}
     the output: {'a.f': [1, 2, 3], 'e': 2, 'a.b': '1', 'a.c.d': '2'}
+    Only plain dicts are squashed; other mapping types are kept as values.
+    An input_dict that is already flat is returned itself, not a copy.
     """
+    # Most values are leaves, so nesting is checked by comparing value.__class__ against
+    # dict directly, which skips the type() call and isinstance's subclass checks.
+    if not any(value.__class__ is dict for value in input_dict.values()):
+        return input_dict
+
     output = {}
-    for key, value in input_dict.items():
-        if isinstance(value, dict):
-            temp_output = squash_dict(value)
-            for key2, value2 in temp_output.items():
-                temp_key = key + delimiter + key2
-                output[temp_key] = value2
-        else:
-            output[key] = value
+    # Walk the nesting with an explicit stack of (key prefix, dict) instead of
+    # recursing, so leaf values are written straight into the single output dict.
+    # Prefixes already end with the delimiter, so each key is built with one format.
+    stack = [("", input_dict)]
+    while stack:
+        prefix, current = stack.pop()
+        for key, value in current.items():
+            full_key = f"{prefix}{key}" if prefix else key
+            if value.__class__ is dict:
+                stack.append((f"{full_key}{delimiter}", value))
+            else:
+                output[full_key] = value
     return output
 
 
@@ -47,39 +61,37 @@ def get_superset_of_keys(dicts):
     """
     Iterates through all the input dicts and returns a superset of keys
     """
-    output_set = set()
-    for _, item in dicts.items():
-        output_set.update(item.keys())
-    return output_set
+    return set().union(*[item.keys() for item in dicts.values()])
 
 
-def standardize_metadata_by_repo(metadata_by_repo):
+class MetadataStore:
     """
-    Input: dict: squashed dict of one level(no dict nesting)
-    Parses through metadata_by_repo dict, finds all possible keys(superset) from
-    the metadata_by_repo and makes sure the same keys exist in each dict.
-    If a key is missing, it's added with a None value
+    Squashed metadata_by_repo that is kept standardized as repos are added one at a time:
+    every repo is squashed to one level and has the same keys, missing ones set to None.
 
-    TODO(jinder): standardize is not the right name,
-    there is a better word for: making all metadata_by_repo have the same keys
+    Each add only back-fills the keys that are new to the store instead of rescanning every repo.
     """
-    superset_keys = get_superset_of_keys(metadata_by_repo)
-    defaults = {k: None for k in superset_keys}
-    output = {}
-    for dict_name, item in metadata_by_repo.items():
-        superset_output = defaults.copy()
-        superset_output.update(item)
-        output[dict_name] = superset_output
-    return output
 
+    def __init__(self):
+        self.repos = {}
+        self.superset_keys = set()
 
-def squash_and_standardize_metadata_by_repo(metadata_by_repo):
-    """
-    Squashes all metadata_by_repo to only one level and makes sure each has the same keys
-    """
-    for dict_name, item in metadata_by_repo.items():
-        metadata_by_repo[dict_name] = squash_dict(item)
-    return standardize_metadata_by_repo(metadata_by_repo)
+    def add(self, repo_name, metadata):
+        """
+        Squash metadata and store it under repo_name, giving every repo the same keys
+        """
+        squashed = squash_dict(metadata)
+        # squash_dict hands back already-flat input itself; copy it so the caller's dict isn't filled in
+        if squashed is metadata:
+            squashed = dict(metadata)
+        new_keys = squashed.keys() - self.superset_keys
+        if new_keys:
+            new_defaults = dict.fromkeys(new_keys)
+            for item in self.repos.values():
+                item.update(new_defaults)
+            self.superset_keys |= new_keys
+        squashed.update(dict.fromkeys(self.superset_keys - squashed.keys()))
+        self.repos[repo_name] = squashed
 
 
 def get_sheets(parsed_yaml_file, sheet_name):
@@ -104,36 +116,40 @@ def get_sheets(parsed_yaml_file, sheet_name):
     return sheet_configuration
 
 
-def write_squashed_metadata_to_csv(metadata_by_repo, filename, configuration):
+def write_squashed_metadata_to_csv(metadata_by_repo, filename, configuration, superset_keys=None):
     """
     Assume all the metadata_by_repo have the same keys
+
+    superset_keys can be passed in if the caller already has them; otherwise,
+    since every repo has the same keys, they're taken from any one repo.
     """
-    superset_keys = get_superset_of_keys(metadata_by_repo)
-    for key in configuration["check_order"]:
-        superset_keys.discard(key)
+    check_order = configuration["check_order"]
+    key_aliases = configuration["key_aliases"]
+
+    if superset_keys is None:
+        superset_keys = next(iter(metadata_by_repo.values()), {}).keys()
     if configuration.get("subset", False):
-        sorted_keys = configuration["check_order"]
+        sorted_keys = check_order
     else:
-        sorted_keys = configuration["check_order"] + list(sorted(superset_keys))
+        remaining_keys = set(superset_keys) - set(check_order)
+        sorted_keys = check_order + sorted(remaining_keys)
 
     # change key names to its alias for display(csv header row)
-    sorted_aliased_keys = []
-    for key in sorted_keys:
-        if key in configuration["key_aliases"]:
-            sorted_aliased_keys.append(configuration["key_aliases"][key])
-        else:
-            sorted_aliased_keys.append(key)
-
-    with open(filename + ".csv", "w", encoding="utf8") as csvfile:
+    csv_header = ["repo_name", *map(key_aliases.get, sorted_keys, sorted_keys)]
+
+    # TODO(jinder): order repos based on configuration["repo_name_order"]
+    # map(item.get, ...) does the lookups in C and gives None for check_order
+    # keys that no repo has (operator.itemgetter would raise KeyError there).
+    # Rows are generated as they are written instead of being built up front.
+    rows = (
+        (repo_name, *map(item.get, sorted_keys))
+        for repo_name, item in metadata_by_repo.items()
+    )
+
+    with open(filename + ".csv", "w", encoding="utf8", newline="", buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
         writer = csv.writer(csvfile)
-        csv_header = ["repo_name"] + sorted_aliased_keys
         writer.writerow(csv_header)
-
-        # TODO(jinder): order repos based on configuration["repo_name_order"]
-        for repo_name, item in metadata_by_repo.items():
-            writer.writerow(
-                [repo_name] + [item[k] if k in item else None for k in sorted_keys]
-            )
+        writer.writerows(rows)
 
 
 def write_squashed_metadata_to_html(metadata_by_repo=None, filename="dashboard.html"):
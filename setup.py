@@ -5,19 +5,24 @@ Package metadata for repo_health.
 import os
 import re
 import sys
+from pathlib import Path
 
 from setuptools import setup
 
 
+# Lines starting with any of these are not package requirements
+NON_REQUIREMENT_PREFIXES = ("-r", "#", "-e", "git+", "-c")
+
+
 def get_version(*file_paths):
     """
     Extract the version string from the file at the given relative path fragments.
     """
     filename = os.path.join(os.path.dirname(__file__), *file_paths)
-    version_file = open(filename, encoding="utf8").read()  # pylint: disable=consider-using-with
-    version_match = re.search(r"^__version__ = ['\"]([^'\"]*)['\"]", version_file, re.M)
-    if version_match:
-        return version_match.group(1)
+    for line in Path(filename).read_text(encoding="utf8").splitlines():
+        version_match = re.match(r"__version__ = ['\"]([^'\"]*)['\"]", line)
+        if version_match:
+            return version_match.group(1)
     raise RuntimeError("Unable to find version string.")
 
 
@@ -27,13 +32,12 @@ def load_requirements(*requirements_paths):
     Returns:
         list: Requirements file relative path strings
     """
-    requirements = set()
-    for path in requirements_paths:
-        requirements.update(
-            line.split("#")[0].strip()
-            for line in open(path, encoding="utf8").readlines()  # pylint: disable=consider-using-with
-            if is_requirement(line.strip())
-        )
+    lines = (
+        line.strip()
+        for path in requirements_paths
+        for line in Path(path).read_text(encoding="utf8").splitlines()
+    )
+    requirements = {line.split("#", 1)[0].rstrip() for line in lines if is_requirement(line)}
     return list(requirements)
 
 
@@ -43,7 +47,7 @@ def is_requirement(line):
     Returns:
         bool: True if the line is not blank, a comment, a URL, or an included file
     """
-    return line and not line.startswith(("-r", "#", "-e", "git+", "-c"))
+    return line and not line.startswith(NON_REQUIREMENT_PREFIXES)
 
 
 VERSION = "0.1.6"
@@ -54,7 +58,7 @@ if sys.argv[-1] == "tag":
     os.system("git push --tags")
     sys.exit()
 
-README = open(os.path.join(os.path.dirname(__file__), "README.rst"), encoding="utf8").read()  # pylint: disable=consider-using-with
+README = Path(__file__).with_name("README.rst").read_text(encoding="utf8")
 
 setup(
     name="edx-repo-health",
@@ -38,6 +38,15 @@ def test_js_repo_dependency_check():
     assert dependencies["pypi"]["count"] == 0
 
 
+def test_js_repo_with_empty_package_lock(tmp_path):
+    (tmp_path / "package.json").write_text('{"dependencies": {"react": "^16.0.0"}}', encoding="utf8")
+    (tmp_path / "package-lock.json").write_text("", encoding="utf8")
+    dependencies = get_dependencies(str(tmp_path))
+
+    assert dependencies["js"]["count"] == 1
+    assert dependencies["js.all"]["count"] == 0
+
+
 def test_python_repo_dependency_check():
     repo_path = get_repo_path('fake_repos/python_repo')
     dependencies = get_dependencies(repo_path)
@@ -3,8 +3,11 @@
 
 from unittest.mock import Mock
 
+import responses
+
 from repo_health.check_github import (
     check_settings,
+    get_branch_or_pr_count,
     MODULE_DICT_KEY,
     repo_license_exemptions,
 )
@@ -55,3 +58,21 @@ async def test_check_settings_no_license_exemption_present():
 
     assert "license" in all_results["github"]
     assert all_results["github"]["license"] is None
+
+
+@responses.activate
+def test_get_branch_or_pr_count_uses_last_page(monkeypatch):
+    """
+    Test to make sure the count is read from the page number of the "last" link.
+    """
+    monkeypatch.setenv("GITHUB_TOKEN", "test_token")
+    url = "https://api.github.com/repos/edx/test_repo/branches?per_page=1"
+    responses.add(
+        responses.GET,
+        url,
+        json=[{"name": "master"}],
+        headers={"Link": '<https://api.github.com/repositories/1/branches?per_page=1&page=2>; rel="next", '
+                         '<https://api.github.com/repositories/1/branches?per_page=1&page=42>; rel="last"'},
+    )
+
+    assert get_branch_or_pr_count("test_repo", "branches") == 42
@@ -1,10 +1,15 @@
 import re
 from unittest.mock import patch
 
+import pytest
 import requests
 import responses
 
-from repo_health.check_readme import check_readme_links, module_dict_key
+from repo_health.check_readme import (
+    check_readme_contents,
+    check_readme_links,
+    module_dict_key,
+)
 
 
 @responses.activate
@@ -35,3 +40,21 @@ def test_one_good_one_bad():
     print(bad_links)
     assert len(bad_links) == 1
     assert bad_links[0].startswith(f"{bad_url}: Connection refused by Responses")
+
+
+@pytest.mark.parametrize("readme, expected", [
+    ("Nothing to see here.", {
+        "security": False, "getting-help": False, "irc-missing": True, "mailing-list-missing": True,
+    }),
+    ("""
+        Report security issues to security@edx.org.
+        See https://open.edx.org/getting-help or the `#EDX-CODE` IRC channel.
+        """, {
+        "security": True, "getting-help": True, "irc-missing": False, "mailing-list-missing": True,
+    }),
+])
+def test_check_readme_contents(readme, expected):
+    all_results = {module_dict_key: {}}
+    check_readme_contents(readme, all_results)
+
+    assert all_results[module_dict_key] == expected
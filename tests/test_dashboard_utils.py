@@ -0,0 +1,78 @@
+"""Testing functions in repo_health_dashboard/utils/utils.py"""
+import copy
+import csv
+
+import pytest
+
+from repo_health_dashboard.utils.utils import (
+    MetadataStore,
+    get_superset_of_keys,
+    squash_dict,
+    write_squashed_metadata_to_csv,
+)
+
+
+def test_squash_dict():
+    input_dict = {'a': {'b': '1', 'c': {'d': '2'}, 'f': [1, 2, 3]}, 'e': 2}
+
+    assert squash_dict(input_dict) == {'a.f': [1, 2, 3], 'e': 2, 'a.b': '1', 'a.c.d': '2'}
+
+
+def test_squash_dict_delimiter_applies_at_every_level():
+    input_dict = {'a': {'c': {'d': '2'}}}
+
+    assert squash_dict(input_dict, delimiter="/") == {'a/c/d': '2'}
+
+
+def test_get_superset_of_keys():
+    dicts = {'repo1': {'a': 1, 'b': 2}, 'repo2': {'b': 3, 'c': 4}, 'repo3': {}}
+
+    assert get_superset_of_keys(dicts) == {'a', 'b', 'c'}
+    assert get_superset_of_keys({}) == set()
+
+
+@pytest.mark.parametrize("superset_keys", [None, {'a', 'b', 'c'}])
+def test_write_squashed_metadata_to_csv(tmp_path, superset_keys):
+    metadata_by_repo = {
+        'repo1': {'a': 1, 'b': 'x,y', 'c': None},
+        'repo2': {'a': 2, 'b': None, 'c': 'z'},
+    }
+    configuration = {'check_order': ['c'], 'key_aliases': {'b': 'B'}}
+    filename = str(tmp_path / "dashboard")
+
+    write_squashed_metadata_to_csv(metadata_by_repo, filename, configuration, superset_keys)
+
+    with open(filename + ".csv", encoding="utf8", newline="") as csv_file:
+        rows = list(csv.reader(csv_file))
+    assert rows == [
+        ['repo_name', 'c', 'a', 'B'],
+        ['repo1', '', '1', 'x,y'],
+        ['repo2', 'z', '2', ''],
+    ]
+
+
+def test_squash_dict_returns_flat_input():
+    input_dict = {'a': 1, 'b': [1, 2]}
+
+    assert squash_dict(input_dict) is input_dict
+
+
+def test_metadata_store():
+    metadata_by_repo = {
+        'repo1': {'a': {'b': 1}, 'c': 2},
+        'repo2': {'a': {'d': 3}},
+        'repo3': {'c': 4},
+    }
+    original = copy.deepcopy(metadata_by_repo)
+    store = MetadataStore()
+    for repo_name, metadata in metadata_by_repo.items():
+        store.add(repo_name, metadata)
+
+    assert store.superset_keys == {'a.b', 'a.d', 'c'}
+    assert store.repos == {
+        'repo1': {'a.b': 1, 'a.d': None, 'c': 2},
+        'repo2': {'a.b': None, 'a.d': 3, 'c': None},
+        'repo3': {'a.b': None, 'a.d': None, 'c': 4},
+    }
+    # the caller's dicts, flat or nested, are left untouched
+    assert metadata_by_repo == original